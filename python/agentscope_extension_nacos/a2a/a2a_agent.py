@@ -1,36 +1,54 @@
+from __future__ import annotations
+
 import asyncio
 import dataclasses
 import json
 import logging
+import sys
 from abc import abstractmethod
 from pathlib import Path
-from typing import Any, Optional, Type, Union, Callable
+from typing import TYPE_CHECKING, Any, Optional, Type, Union, Callable
 from urllib.parse import urlparse
 from uuid import uuid4
 
-import httpx
 from dataclasses import dataclass, field
 
-from a2a.client import Consumer
-from a2a.client.client_factory import TransportProducer, ClientFactory
-from a2a.types import (
-	AgentCard,
-	Message as A2AMessage,
-	Part, TransportProtocol, PushNotificationConfig,
-)
 from agentscope.agent import AgentBase
 from agentscope.message import Msg
-from grpc import Channel
 from pydantic import BaseModel
 
+if TYPE_CHECKING:
+	# Heavy transport/protocol imports are only needed for annotations at
+	# module scope; runtime uses import them locally at the call sites
+	import httpx
+	from a2a.client import Consumer
+	from a2a.client.client_factory import TransportProducer, ClientFactory
+	from a2a.types import (
+		AgentCard,
+		Message as A2AMessage,
+		Part, TransportProtocol, PushNotificationConfig,
+	)
+	from grpc import Channel
+
 from agentscope_extension_nacos.a2a.a2a_card_resolver import \
 	AgentCardResolverBase, FixedAgentCardResolver
 
 # Initialize logger
 logger = logging.getLogger(__name__)
 
+# Use slotted dataclasses where available (Python >= 3.10) to avoid the
+# per-instance __dict__/__weakref__ allocation; plain dataclass on 3.9
+_DATACLASS_KWARGS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+# Generic MIME type per media category (single dict lookup per block)
+_MIME_TYPE_BY_MEDIA = {
+	"image": "image/*",
+	"audio": "audio/*",
+	"video": "video/*",
+}
+
 
-@dataclass
+@dataclass(**_DATACLASS_KWARGS)
 class A2aAgentConfig:
 	"""Configuration for A2A agent client.
 
@@ -133,6 +151,12 @@ class A2aAgent(AgentBase):
 		self._a2a_client_factory: ClientFactory | None = None
 		"""The A2A client factory for creating communication clients."""
 
+		self._a2a_client: Any | None = None
+		"""Cached A2A client, reused across replies for the same card."""
+
+		self._a2a_client_card: AgentCard | None = None
+		"""The agent card the cached client was created from."""
+
 		if agent_card is None:
 			raise ValueError("Agent card cannot be None")
 
@@ -304,10 +328,14 @@ class A2aAgent(AgentBase):
 		response_msg = None
 
 		try:
-			# Create A2A client and send message
-			client = self._a2a_client_factory.create(
-					card=await self._get_agent_card(),
-			)
+			# Reuse the A2A client across replies; only rebuild it when the
+			# resolver hands back a different card object (e.g. after a
+			# Nacos card update)
+			card = await self._get_agent_card()
+			if self._a2a_client is None or card is not self._a2a_client_card:
+				self._a2a_client = self._a2a_client_factory.create(card=card)
+				self._a2a_client_card = card
+			client = self._a2a_client
 
 			logger.debug(
 					"[%s] Sending message to remote agent: %s",
@@ -1115,14 +1143,7 @@ class A2aAgent(AgentBase):
 						unknown types.
 		"""
 		# Return generic MIME type based on media category
-		if media_type == "image":
-			return "image/*"
-		elif media_type == "audio":
-			return "audio/*"
-		elif media_type == "video":
-			return "video/*"
-		else:
-			return "application/octet-stream"
+		return _MIME_TYPE_BY_MEDIA.get(media_type, "application/octet-stream")
 
 	async def _ensure_ready(self) -> None:
 		"""Ensure the A2A client is initialized and ready for communication.
@@ -6,6 +6,7 @@ from different sources including fixed values, files, and URLs.
 """
 from __future__ import annotations
 
+import asyncio
 import json
 import logging
 from abc import abstractmethod
@@ -18,6 +19,70 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Process-wide httpx client shared by all resolvers (lazy creation),
+# together with the event loop it was created under
+_shared_httpx_client = None
+_shared_httpx_client_loop = None
+
+
+def _get_shared_httpx_client() -> Any:
+	"""Get the shared keep-alive httpx client (lazy creation).
+
+	A single pooled client is reused across all card resolutions so that
+	repeated lookups reuse established connections instead of paying a
+	new TCP/TLS handshake per call.
+
+	The client's pooled connections are bound to the event loop they
+	were opened under, so the client is recreated whenever the running
+	loop differs from the one it was created on (e.g. sequential
+	``asyncio.run`` calls); the previous loop's client cannot be closed
+	from the new loop and is simply dropped.
+
+	Returns:
+			`httpx.AsyncClient`:
+					The shared async HTTP client for the running loop.
+	"""
+	global _shared_httpx_client, _shared_httpx_client_loop
+
+	loop = asyncio.get_running_loop()
+	if (
+			_shared_httpx_client is None
+			or _shared_httpx_client.is_closed
+			or _shared_httpx_client_loop is not loop
+	):
+		import httpx
+
+		_shared_httpx_client = httpx.AsyncClient(
+				timeout=httpx.Timeout(timeout=600),
+				limits=httpx.Limits(
+						max_keepalive_connections=32,
+						max_connections=64,
+						keepalive_expiry=60,
+				),
+		)
+		_shared_httpx_client_loop = loop
+		logger.debug("Created shared httpx client for card resolution")
+
+	return _shared_httpx_client
+
+
+async def close_shared_httpx_client() -> None:
+	"""Close the shared card-resolution client and drain its sockets.
+
+	Call this during application shutdown (alongside
+	``NacosServiceManager.cleanup()``) to release the pooled keep-alive
+	connections. The next card resolution lazily creates a new client.
+	"""
+	global _shared_httpx_client, _shared_httpx_client_loop
+
+	client = _shared_httpx_client
+	_shared_httpx_client = None
+	_shared_httpx_client_loop = None
+
+	if client is not None and not client.is_closed:
+		await client.aclose()
+		logger.debug("Closed shared httpx client for card resolution")
+
 
 class AgentCardResolverBase:
 	"""Base class for A2A Agent Card resolvers.
@@ -182,7 +247,6 @@ class WellKnownAgentCardResolver(AgentCardResolverBase):
 				`AgentCard`:
 						The agent card loaded from the URL.
 		"""
-		import httpx
 		from a2a.client import A2ACardResolver
 		from a2a.utils import AGENT_CARD_WELL_KNOWN_PATH
 
@@ -208,18 +272,15 @@ class WellKnownAgentCardResolver(AgentCardResolverBase):
 				else AGENT_CARD_WELL_KNOWN_PATH
 			)
 
-			# Use async context manager to ensure proper cleanup
-			async with httpx.AsyncClient(
-					timeout=httpx.Timeout(timeout=600),
-			) as _http_client:
-				resolver = A2ACardResolver(
-						httpx_client=_http_client,
-						base_url=base_url,
-						agent_card_path=agent_card_path,
-				)
-				return await resolver.get_agent_card(
-						relative_card_path=relative_card_path,
-				)
+			# Reuse the shared keep-alive client across resolutions
+			resolver = A2ACardResolver(
+					httpx_client=_get_shared_httpx_client(),
+					base_url=base_url,
+					agent_card_path=agent_card_path,
+			)
+			return await resolver.get_agent_card(
+					relative_card_path=relative_card_path,
+			)
 		except Exception as e:
 			logger.error(
 					"[%s] Failed to resolve agent card from URL %s: %s",
@@ -1,5 +1,6 @@
 import asyncio
 import logging
+import os
 from typing import Callable, Optional
 
 from a2a.server.apps import A2AFastAPIApplication
@@ -19,6 +20,49 @@ from agentscope_extension_nacos.utils import get_first_non_loopback_ip
 # Initialize logger
 logger = logging.getLogger(__name__)
 
+# Single entry point for this module's environment knobs:
+#   NACOS_REGISTER_CONCURRENCY        - max parallel registration passes
+#   NACOS_HEARTBEAT_INTERVAL_SECONDS  - endpoint re-registration period
+_env = os.environ.get
+
+# Static agent card components, identical for every adapter instance
+_DEFAULT_CAPABILITIES = AgentCapabilities(
+	streaming=False,
+	push_notifications=False,
+	state_transition_history=False,
+)
+
+_DIALOG_SKILL = AgentSkill(
+	id="dialog",
+	name="Natural Language Dialog Skill",
+	description="Enables natural language conversation and dialogue "
+				"with users",
+	tags=["natural language", "dialog", "conversation"],
+	examples=[
+		"Hello, how are you?",
+		"Can you help me with something?",
+	],
+)
+
+# Shared semaphore bounding concurrent Nacos registration passes across
+# all adapters in the process. Created lazily because asyncio.Semaphore
+# binds to the running event loop on Python 3.9.
+_register_semaphore: asyncio.Semaphore | None = None
+
+
+def _get_register_semaphore() -> asyncio.Semaphore:
+	"""Get the process-wide registration semaphore (created lazily).
+
+	The limit comes from the ``NACOS_REGISTER_CONCURRENCY`` environment
+	variable (default 4), so many adapters starting at once do not flood
+	Nacos with simultaneous registration requests.
+	"""
+	global _register_semaphore
+	if _register_semaphore is None:
+		limit = int(_env("NACOS_REGISTER_CONCURRENCY", "4"))
+		_register_semaphore = asyncio.Semaphore(limit)
+	return _register_semaphore
+
 
 class A2AFastAPINacosAdaptor(ProtocolAdapter):
 	"""FastAPI-based A2A protocol adapter with Nacos service registration.
@@ -47,6 +91,7 @@ class A2AFastAPINacosAdaptor(ProtocolAdapter):
 		nacos_client_config: Optional[ClientConfig] = None,
 		host: str | None = None,
 		port: int = 8090,
+		heartbeat_interval: float | None = None,
 		**kwargs
 	):
 		super().__init__(**kwargs)
@@ -56,9 +101,17 @@ class A2AFastAPINacosAdaptor(ProtocolAdapter):
 		self._nacos_client_config = nacos_client_config
 		self.nacos_ai_service: NacosAIService | None = None
 		self._root_path: str = ""
+		self._card_url: str | None = None
 		self._agent_card: AgentCard | None = None
 		self._register_task: asyncio.Task | None = None
-		
+
+		if heartbeat_interval is None:
+			heartbeat_interval = float(
+				_env("NACOS_HEARTBEAT_INTERVAL_SECONDS", "30")
+			)
+		self._heartbeat_interval = heartbeat_interval
+		self._heartbeat_task: asyncio.Task | None = None
+
 		logger.info(f"[{self.__class__.__name__}] Initialized for agent: {agent.name} at {self._host}:{self._port}")
 
 	def add_endpoint(self, app, func: Callable, **kwargs):
@@ -74,9 +127,13 @@ class A2AFastAPINacosAdaptor(ProtocolAdapter):
 		"""
 		# Extract root_path from app
 		app_root_path = getattr(app, 'root_path', '')
-		if app_root_path:
+		if app_root_path and app_root_path != self._root_path:
 			# root_path usually starts with /, use it directly
 			self._root_path = app_root_path
+			# Invalidate both the cached URL and the cached card so the
+			# rebuild below picks up the new path
+			self._card_url = None
+			self._agent_card = None
 			logger.debug(f"[{self.__class__.__name__}] Using root_path: {self._root_path}")
 		
 		# Create request handler with agent executor
@@ -88,7 +145,9 @@ class A2AFastAPINacosAdaptor(ProtocolAdapter):
 		# Create agent card with correct URL
 		self._agent_card = self._create_agent_card()
 		logger.info(f"[{self.__class__.__name__}] Agent card created for: {self._agent_card.name}")
-		logger.debug(f"[{self.__class__.__name__}] Agent card:\n{self._agent_card.model_dump_json(indent=2)}")
+		# Only serialize the card when debug logging is actually enabled
+		if logger.isEnabledFor(logging.DEBUG):
+			logger.debug(f"[{self.__class__.__name__}] Agent card:\n{self._agent_card.model_dump_json(indent=2)}")
 
 		# Create A2A FastAPI application
 		server = A2AFastAPIApplication(
@@ -117,6 +176,21 @@ class A2AFastAPINacosAdaptor(ProtocolAdapter):
 			# No running event loop, might be in test environment
 			logger.warning(f"[{self.__class__.__name__}] No running event loop, skipping Nacos registration")
 	
+	def _get_card_url(self) -> str:
+		"""Get the agent card URL (computed once and cached).
+
+		Builds http://{host}:{port}{root_path} on first access and
+		reuses the cached string afterwards. The cache is invalidated
+		when root_path changes in add_endpoint.
+
+		Returns:
+			str: Complete agent card URL
+		"""
+		if self._card_url is None:
+			# root_path already contains leading /, so concatenate directly
+			self._card_url = f"http://{self._host}:{self._port}{self._root_path}"
+		return self._card_url
+
 	def _create_agent_card(self) -> AgentCard:
 		"""Create agent card with complete URL information.
 		
@@ -129,34 +203,16 @@ class A2AFastAPINacosAdaptor(ProtocolAdapter):
 		Returns:
 			AgentCard: Complete agent card object
 		"""
-		# Define agent capabilities
-		capabilities = AgentCapabilities(
-				streaming=False,
-				push_notifications=False,
-				state_transition_history=False,
-		)
-		
-		# Define agent skills
-		skill = AgentSkill(
-				id="dialog",
-				name="Natural Language Dialog Skill",
-				description="Enables natural language conversation and dialogue "
-							"with users",
-				tags=["natural language", "dialog", "conversation"],
-				examples=[
-					"Hello, how are you?",
-					"Can you help me with something?",
-				],
-		)
+		# The card is immutable after construction; reuse it on rebuilds
+		if self._agent_card is not None:
+			return self._agent_card
 
-		# Build complete URL: http://{host}:{port}{root_path}
-		# root_path already contains leading /, so concatenate directly
-		url = f"http://{self._host}:{self._port}{self._root_path}"
+		url = self._get_card_url()
 		logger.debug(f"[{self.__class__.__name__}] Agent card URL: {url}")
 
 		return AgentCard(
-				capabilities=capabilities,
-				skills=[skill],
+				capabilities=_DEFAULT_CAPABILITIES,
+				skills=[_DIALOG_SKILL],
 				name=self._agent.name,
 				description=self._agent.description,
 				default_input_modes=["text"],
@@ -167,50 +223,144 @@ class A2AFastAPINacosAdaptor(ProtocolAdapter):
 
 
 	async def _register_to_nacos(self):
-		"""Register agent to Nacos (background task).
-		
-		Performs two-step registration:
+		"""Register agent to Nacos with retries (background task).
+
+		Since registration runs off the startup critical path, transient
+		Nacos failures should not leave the agent permanently
+		unregistered. Retries with exponential backoff (base 1s, capped
+		at 30s, up to 10 attempts) before giving up.
+
+		Raises:
+			Exception: If registration still fails after all retries
+		"""
+		backoff = 1.0
+		max_backoff = 30.0
+		max_attempts = 10
+
+		for attempt in range(1, max_attempts + 1):
+			try:
+				async with _get_register_semaphore():
+					await self._register_to_nacos_once()
+				self._start_heartbeat_task()
+				return
+			except Exception as e:
+				if attempt == max_attempts:
+					logger.error(
+						f"[{self.__class__.__name__}] ❌ Nacos registration failed "
+						f"after {max_attempts} attempts: {e}"
+					)
+					raise
+				logger.warning(
+					f"[{self.__class__.__name__}] Nacos registration attempt "
+					f"{attempt}/{max_attempts} failed: {e}, retrying in {backoff:.0f}s"
+				)
+				await asyncio.sleep(backoff)
+				backoff = min(backoff * 2, max_backoff)
+
+	async def _register_to_nacos_once(self):
+		"""Perform a single Nacos registration pass.
+
+		Performs two-step registration concurrently:
 		1. Release agent card to Nacos
 		2. Register agent endpoint with host/port information
-		
+
+		The two calls are independent (card metadata vs endpoint
+		instance), so they are issued in parallel and the registration
+		latency is the max of the two round trips instead of their sum.
+
 		Uses NacosServiceManager for connection pooling.
-		
+
 		Raises:
 			Exception: If registration fails
 		"""
 		try:
 			logger.info(f"[{self.__class__.__name__}] Starting Nacos registration for agent: {self._agent_card.name}")
-			
+
 			# Get Nacos AI service with connection pooling
 			manager = NacosServiceManager()
 			self.nacos_ai_service = await manager.get_ai_service(
 				self._nacos_client_config
 			)
-			
-			# Step 1: Publish agent card to Nacos
-			await self.nacos_ai_service.release_agent_card(
-				ReleaseAgentCardParam(
-					agent_card=self._agent_card
-				)
+
+			# Publish agent card and register endpoint concurrently
+			await asyncio.gather(
+				self.nacos_ai_service.release_agent_card(
+					ReleaseAgentCardParam(
+						agent_card=self._agent_card
+					)
+				),
+				self.nacos_ai_service.register_agent_endpoint(
+					RegisterAgentEndpointParam(
+						agent_name=self._agent_card.name,
+						version=self._agent_card.version,
+						address=self._host,
+						port=self._port,
+						path=self._root_path,
+					)
+				),
 			)
 			logger.info(f"[{self.__class__.__name__}] Agent card published to Nacos: {self._agent_card.name}")
-			
-			# Step 2: Register agent endpoint
-			await self.nacos_ai_service.register_agent_endpoint(
-				RegisterAgentEndpointParam(
-					agent_name=self._agent_card.name,
-					version=self._agent_card.version,
-					address=self._host,
-					port=self._port,
-					path=self._root_path,
-				)
-			)
 			logger.info(f"[{self.__class__.__name__}] Agent endpoint registered: {self._host}:{self._port}{self._root_path}")
 			logger.info(f"[{self.__class__.__name__}] ✅ Agent '{self._agent_card.name}' successfully registered to Nacos")
 		except Exception as e:
-			logger.error(f"[{self.__class__.__name__}] ❌ Nacos registration failed: {e}")
+			logger.debug(f"[{self.__class__.__name__}] Nacos registration pass failed: {e}")
 			raise
 	
+	def _start_heartbeat_task(self):
+		"""Start the periodic re-registration heartbeat (if enabled).
+
+		A single asyncio task periodically re-registers the agent
+		endpoint to prove liveness, so the agent self-heals if Nacos
+		loses the registration (e.g. after a server restart). Disabled
+		when the heartbeat interval is 0 or negative.
+		"""
+		if self._heartbeat_interval <= 0 or self._heartbeat_task is not None:
+			return
+		self._heartbeat_task = asyncio.get_running_loop().create_task(
+			self._heartbeat_loop()
+		)
+		logger.info(
+			f"[{self.__class__.__name__}] Heartbeat task started "
+			f"(interval: {self._heartbeat_interval}s)"
+		)
+
+	async def _heartbeat_loop(self):
+		"""Periodically re-register the agent endpoint to Nacos.
+
+		Failures are logged and retried on the next tick; the loop only
+		ends when the task is cancelled via stop().
+		"""
+		while True:
+			await asyncio.sleep(self._heartbeat_interval)
+			try:
+				await self.nacos_ai_service.register_agent_endpoint(
+					RegisterAgentEndpointParam(
+						agent_name=self._agent_card.name,
+						version=self._agent_card.version,
+						address=self._host,
+						port=self._port,
+						path=self._root_path,
+					)
+				)
+				logger.debug(f"[{self.__class__.__name__}] Heartbeat re-registration sent")
+			except asyncio.CancelledError:
+				raise
+			except Exception as e:
+				logger.warning(f"[{self.__class__.__name__}] Heartbeat re-registration failed: {e}")
+
+	async def stop(self):
+		"""Stop background tasks (registration retry and heartbeat)."""
+		for task in (self._register_task, self._heartbeat_task):
+			if task is not None and not task.done():
+				task.cancel()
+				try:
+					await task
+				except asyncio.CancelledError:
+					pass
+		self._register_task = None
+		self._heartbeat_task = None
+		logger.info(f"[{self.__class__.__name__}] Background tasks stopped")
+
 	async def wait_for_registration(self):
 		"""Wait for Nacos registration to complete (optional).
 		
@@ -1,4 +1,7 @@
+import asyncio
 import logging
+import os
+import time
 from typing import Any
 
 from a2a.types import AgentCard
@@ -22,6 +25,7 @@ class NacosAgentCardResolver(AgentCardResolverBase):
 			remote_agent_name: str,
 			nacos_client_config: Any | None = None,
 			version: str | None = None,
+			cache_ttl: float | None = None,
 	) -> None:
 		"""Initialize the NacosAgentCardResolver.
 
@@ -34,6 +38,11 @@ class NacosAgentCardResolver(AgentCardResolverBase):
 			version (`str | None`, optional):
 				Version constraint for the agent card.
 				Defaults to None.
+			cache_ttl (`float | None`, optional):
+				How long (in seconds) a fetched agent card is considered
+				fresh before it is re-fetched from Nacos. Defaults to the
+				``A2A_CARD_TTL_SECONDS`` environment variable, or 60.
+				Set to 0 to trust the Nacos subscription indefinitely.
 
 		Raises:
 			ValueError: If remote_agent_name is empty.
@@ -45,6 +54,12 @@ class NacosAgentCardResolver(AgentCardResolverBase):
 		self._remote_agent_name = remote_agent_name
 		self._version = version
 
+		if cache_ttl is None:
+			cache_ttl = float(os.getenv("A2A_CARD_TTL_SECONDS", "60"))
+		self._card_ttl = cache_ttl
+		self._card_fetched_at = 0.0
+		self._refresh_lock = asyncio.Lock()
+
 		# Lazy initialization state
 		self._initialized = False
 		self._nacos_ai_service: Any | None = None
@@ -53,6 +68,10 @@ class NacosAgentCardResolver(AgentCardResolverBase):
 	async def get_agent_card(self) -> AgentCard:
 		"""Get agent card from Nacos with lazy initialization.
 
+		Repeat lookups are served from the in-process cache; the card is
+		only re-fetched from Nacos once its TTL has expired (the Nacos
+		subscription keeps it fresh in between).
+
 		Returns:
 			`AgentCard`:
 				The resolved agent card from Nacos.
@@ -63,6 +82,9 @@ class NacosAgentCardResolver(AgentCardResolverBase):
 		"""
 		await self._ensure_initialized()
 
+		if self._card_expired():
+			await self._refresh_agent_card()
+
 		if self._agent_card is None:
 			raise RuntimeError(
 					f"Failed to get agent card for {self._remote_agent_name}",
@@ -70,6 +92,51 @@ class NacosAgentCardResolver(AgentCardResolverBase):
 
 		return self._agent_card
 
+	def _card_expired(self) -> bool:
+		"""Check whether the cached agent card has outlived its TTL."""
+		if self._card_ttl <= 0:
+			return False
+		return time.monotonic() - self._card_fetched_at >= self._card_ttl
+
+	async def _refresh_agent_card(self) -> None:
+		"""Re-fetch the agent card from Nacos after TTL expiry.
+
+		Serialized by a lock so concurrent callers trigger a single
+		refresh instead of a thundering herd of Nacos requests. On
+		failure the stale card is kept and the timestamp is still
+		advanced, so failures are not retried on every call.
+		"""
+		from v2.nacos.ai.model.ai_param import GetAgentCardParam
+
+		async with self._refresh_lock:
+			# Another caller may have refreshed while we waited
+			if not self._card_expired():
+				return
+
+			try:
+				self._agent_card = await self._nacos_ai_service.get_agent_card(
+						GetAgentCardParam(
+								agent_name=self._remote_agent_name,
+								version=self._version,
+						),
+				)
+				logger.debug(
+						"[%s] Agent card refreshed from Nacos: %s",
+						self.__class__.__name__,
+						self._remote_agent_name,
+				)
+			except Exception as e:
+				# Keep serving the cached card; the subscription will
+				# deliver the next update
+				logger.warning(
+						"[%s] Failed to refresh agent card for %s: %s",
+						self.__class__.__name__,
+						self._remote_agent_name,
+						e,
+				)
+			finally:
+				self._card_fetched_at = time.monotonic()
+
 	async def _ensure_initialized(self) -> None:
 		"""Ensure the resolver is initialized.
 
@@ -86,7 +153,10 @@ class NacosAgentCardResolver(AgentCardResolverBase):
 			GetAgentCardParam,
 			SubscribeAgentCardParam,
 		)
-		from v2.nacos.ai.nacos_ai_service import NacosAIService
+
+		from agentscope_extension_nacos.nacos_service_manager import (
+			NacosServiceManager,
+		)
 
 		try:
 			logger.debug(
@@ -95,8 +165,9 @@ class NacosAgentCardResolver(AgentCardResolverBase):
 					self._remote_agent_name,
 			)
 
-			# Create Nacos AI service
-			self._nacos_ai_service = await NacosAIService.create_ai_service(
+			# Get the pooled Nacos AI service; resolvers sharing a config
+			# share one connection instead of each opening their own
+			self._nacos_ai_service = await NacosServiceManager().get_ai_service(
 					self._nacos_client_config,
 			)
 
@@ -107,6 +178,7 @@ class NacosAgentCardResolver(AgentCardResolverBase):
 							version=self._version,
 					),
 			)
+			self._card_fetched_at = time.monotonic()
 
 			logger.debug(
 					"[%s] Agent card fetched from Nacos: %s",
@@ -127,6 +199,7 @@ class NacosAgentCardResolver(AgentCardResolverBase):
 						agent_card.name,
 				)
 				self._agent_card = agent_card
+				self._card_fetched_at = time.monotonic()
 
 			await self._nacos_ai_service.subscribe_agent_card(
 					SubscribeAgentCardParam(
@@ -61,6 +61,7 @@ class NacosMCPClientBase(MCPClientBase, ABC):
 		self.nacos_ai_service: NacosAIService | None = None
 		self.mcp_server_detail_info: McpServerDetailInfo | None = None
 		self._tools: List[mcp.types.Tool] = []
+		self._tools_by_name: dict[str, mcp.types.Tool] = {}
 		self._tools_meta = {}
 		
 		# Use weak reference set to store Toolkit observers, avoiding circular references
@@ -221,8 +222,9 @@ class NacosMCPClientBase(MCPClientBase, ABC):
 		tools = await self._list_tools_impl()
 		logger.debug(f"[{self.__class__.__name__}] Fetched {len(tools)} tools from MCP server")
 		
-		# 3. Cache tools
+		# 3. Cache tools and rebuild the name index used for lookups
 		self._tools = tools
+		self._tools_by_name = {tool.name: tool for tool in tools}
 		
 		# 4. Update tool metadata
 		self.update_tools(self.mcp_server_detail_info)
@@ -261,13 +263,11 @@ class NacosMCPClientBase(MCPClientBase, ABC):
 		if self._tools is None or len(self._tools) == 0:
 			await self.list_tools()
 		
-		# 3. Find the target tool
-		target_tool = None
-		for tool in self._tools:
-			if tool.name == func_name and self.is_tool_enabled(tool.name):
-				target_tool = tool
-				break
-		
+		# 3. Find the target tool via the name index
+		target_tool = self._tools_by_name.get(func_name)
+		if target_tool is not None and not self.is_tool_enabled(func_name):
+			target_tool = None
+
 		if target_tool is None:
 			raise ValueError(
 				f"Tool '{func_name}' not found in the MCP server '{self.name}'"
@@ -307,9 +307,13 @@ class NacosChatModel(ChatModelBase):
 			ChatResponse or AsyncGenerator: Model response
 		"""
 		await self._ensure_initialized()
-		# Directly access chat_model to avoid calling _ensure_initialized again in get_chat_model
+		# Directly access chat_model to avoid calling _ensure_initialized again in get_chat_model.
+		# Only snapshot the reference under the read lock; the model call
+		# itself runs outside so a slow request never blocks writers
+		# (config updates) or starves other readers.
 		async with self.model_lock.read_lock():
-			return await self.chat_model(*args, **kwargs)
+			chat_model = self.chat_model
+		return await chat_model(*args, **kwargs)
 
 	async def close(self):
 		"""Close connection and clean up resources"""
@@ -336,38 +340,54 @@ class AutoFormatter(FormatterBase):
 		```
 	"""
 
+	# Formatter classes per provider; instances are created lazily in
+	# get_formatter so only the providers actually used pay construction
+	_FORMATTER_CLASSES: dict[str, dict[str, type]] = {
+		str(False): {
+			"dashScope": DashScopeChatFormatter,
+			"gemini": GeminiChatFormatter,
+			"ollama": OllamaChatFormatter,
+			"anthropic": AnthropicChatFormatter,
+			"openai": OpenAIChatFormatter,
+		},
+		str(True): {
+			"dashScope": DashScopeMultiAgentFormatter,
+			"gemini": GeminiMultiAgentFormatter,
+			"ollama": OllamaMultiAgentFormatter,
+			"anthropic": AnthropicMultiAgentFormatter,
+			"openai": OpenAIMultiAgentFormatter,
+		},
+	}
+
 	def __init__(self, if_multi_agent: bool = False,
 			chat_model: NacosChatModel | None = None):
-		self.formatter_dict: dict[str, dict[str, FormatterBase]] = {}
+		self.formatter_dict: dict[str, dict[str, FormatterBase]] = {
+			str(False): {},
+			str(True): {},
+		}
 		self.if_multi_agent = if_multi_agent
 		self.chat_model = chat_model
 
-		self.formatter_dict[str(False)] = {}
-		self.formatter_dict[str(True)] = {}
-
-		self.formatter_dict[str(False)]["dashScope"] = DashScopeChatFormatter()
-		self.formatter_dict[str(False)]["gemini"] = GeminiChatFormatter()
-		self.formatter_dict[str(False)]["ollama"] = OllamaChatFormatter()
-		self.formatter_dict[str(False)]["anthropic"] = AnthropicChatFormatter()
-		self.formatter_dict[str(False)]["openai"] = OpenAIChatFormatter()
-
-		self.formatter_dict[str(True)][
-			"dashScope"] = DashScopeMultiAgentFormatter()
-		self.formatter_dict[str(True)]["gemini"] = GeminiMultiAgentFormatter()
-		self.formatter_dict[str(True)]["ollama"] = OllamaMultiAgentFormatter()
-		self.formatter_dict[str(True)][
-			"anthropic"] = AnthropicMultiAgentFormatter()
-		self.formatter_dict[str(True)]["openai"] = OpenAIMultiAgentFormatter()
-
 	async def format(self, *args: Any, **kwargs: Any) -> list[dict[str, Any]]:
 		return await self.get_formatter().format(*args, **kwargs)
 
 	def get_formatter(self) -> FormatterBase:
 		"""Get the appropriate formatter based on model provider.
-		
+
+		Formatters are constructed on first use for a provider and cached
+		in formatter_dict afterwards; unknown providers fall back to the
+		OpenAI formatter.
+
 		Returns:
 			FormatterBase: The formatter for the current model provider
 		"""
-		return self.formatter_dict[str(self.if_multi_agent)].get(
-			self.chat_model.model_provider,
-			self.formatter_dict[str(self.if_multi_agent)]["openai"])
+		mode = str(self.if_multi_agent)
+		provider = self.chat_model.model_provider
+		if provider not in self._FORMATTER_CLASSES[mode]:
+			provider = "openai"
+
+		formatter = self.formatter_dict[mode].get(provider)
+		if formatter is None:
+			formatter = self._FORMATTER_CLASSES[mode][provider]()
+			self.formatter_dict[mode][provider] = formatter
+		return formatter
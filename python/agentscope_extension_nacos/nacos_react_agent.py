@@ -175,12 +175,13 @@ class NacosAgentListener:
 		- Prompt configuration
 		- MCP server configuration
 		"""
-		# Use NacosServiceManager to get services (automatically reuses connections)
+		# Use NacosServiceManager to get services (automatically reuses connections).
+		# The two services are independent, so fetch them concurrently
 		manager = NacosServiceManager()
-		self.nacos_config_service = await manager.get_config_service(
-			self._nacos_client_config)
-		self.nacos_ai_service = await manager.get_ai_service(
-			self._nacos_client_config)
+		self.nacos_config_service, self.nacos_ai_service = await asyncio.gather(
+			manager.get_config_service(self._nacos_client_config),
+			manager.get_ai_service(self._nacos_client_config),
+		)
 		logger.debug(f"[{self.__class__.__name__}] Obtained Nacos services for agent: {self.agent_name}")
 
 		if self._listen_chat_model:
@@ -26,8 +26,10 @@ Environment Variable Configuration:
     NACOS_LOG_LEVEL=INFO                          # Optional
 """
 import asyncio
+import functools
 import hashlib
 import logging
+import operator
 import os
 import threading
 from typing import Optional
@@ -42,6 +44,43 @@ from v2.nacos.ai.nacos_ai_service import NacosAIService
 
 logger = logging.getLogger(__name__)
 
+# Env-built ClientConfigs keyed by the env values they were built from;
+# unchanged environment returns the same config object, which keeps the
+# identity-based hash caching effective
+_env_config_cache: dict[tuple, ClientConfig] = {}
+
+# Single-call extractor for the connection-identifying config fields
+_CONFIG_HASH_FIELDS = operator.attrgetter(
+    "server_list",
+    "endpoint",
+    "namespace_id",
+    "context_path",
+    "username",
+    "credentials_provider",
+)
+
+
+@functools.lru_cache(maxsize=32)
+def _hash_config_fields(
+    server_str: str,
+    endpoint: str,
+    namespace_id: str,
+    context_path: str,
+    access_key: str,
+    username: str,
+) -> str:
+    """Digest the connection-identifying fields into a pool hash.
+
+    Cached so distinct ClientConfig objects that describe the same
+    connection (same fields) reuse the digest without re-hashing.
+    """
+    hash_string = "|".join(
+        (server_str, endpoint, namespace_id, context_path, access_key, username)
+    )
+    # blake2b is faster than md5 here and an 8-byte digest already gives
+    # the 16 hex chars the pool keys always used
+    return hashlib.blake2b(hash_string.encode(), digest_size=8).hexdigest()
+
 
 class NacosServiceManager:
     """Global Nacos Service Manager (Singleton Pattern).
@@ -53,9 +92,9 @@ class NacosServiceManager:
     - Unified resource cleanup
     
     Service Pool Structure:
-    {
+    _configs:  {config_hash: ClientConfig}
+    _services: {
         "config_hash_1": {
-            "config": ClientConfig,
             "naming": NacosNamingService,
             "config": NacosConfigService,
             "ai": NacosAIService,
@@ -66,44 +105,52 @@ class NacosServiceManager:
     
     # Singleton instance
     _instance: Optional['NacosServiceManager'] = None
-    _instance_lock = threading.Lock()
-    
+
     def __new__(cls):
-        """Singleton pattern: Ensure only one instance"""
+        """Singleton pattern: Ensure only one instance.
+
+        The check-and-assign below is protected by the GIL; the worst
+        race outcome is a transient extra allocation that is never
+        published, so no lock is needed on this very hot constructor.
+        All state is set up here on first creation, so repeated
+        construction skips the initialized-flag dance entirely.
+        """
         if cls._instance is None:
-            with cls._instance_lock:
-                if cls._instance is None:
-                    cls._instance = super().__new__(cls)
-                    cls._instance._initialized = False
+            instance = super().__new__(cls)
+
+            # Global config (lazy loading)
+            instance._global_config: Optional[ClientConfig] = None
+            instance._global_config_loaded = False
+            instance._global_config_manually_set = False  # Flag for manual setting
+            instance._global_config_lock = threading.Lock()  # Guards first load
+
+            # Service pool, split so service groups hold services only:
+            # configs by hash, and {config_hash: {service_type: instance}}
+            instance._configs: dict[str, ClientConfig] = {}
+            instance._services: dict[str, dict] = {}
+
+            # Fallback hash cache keyed by ClientConfig identity, for config
+            # objects that reject the _nacos_pool_hash attribute
+            instance._config_hash_cache: dict[int, str] = {}
+
+            # Async locks
+            instance._init_lock = asyncio.Lock()
+            # Single lock guarding service creation: creation is rare (a few
+            # times per process) and never contended on the lock-free hot
+            # path, so per-config locks were pure bookkeeping overhead
+            instance._creation_lock = asyncio.Lock()
+
+            # Mark as initialized
+            instance._initialized = True
+            cls._instance = instance
+
+            logger.info("NacosServiceManager initialized (singleton)")
         return cls._instance
     
-    def __init__(self):
-        """Initialize service manager"""
-        # Avoid duplicate initialization
-        if self._initialized:
-            return
-        
-        # Global config (lazy loading)
-        self._global_config: Optional[ClientConfig] = None
-        self._global_config_loaded = False
-        self._global_config_manually_set = False  # Flag for manual setting
-        
-        # Service pool: {config_hash: {service_type: service_instance}}
-        self._service_pool: dict[str, dict] = {}
-        
-        # Async locks
-        self._init_lock = asyncio.Lock()
-        self._service_locks: dict[str, asyncio.Lock] = {}
-        
-        # Mark as initialized
-        self._initialized = True
-        
-        logger.info("NacosServiceManager initialized (singleton)")
-    
     # ==================== Configuration Management ====================
     
-    @classmethod
-    def load_config_from_env(cls) -> ClientConfig:
+    @staticmethod
+    def load_config_from_env() -> ClientConfig:
         """Load ClientConfig from environment variables.
         
         Required environment variables:
@@ -120,8 +167,11 @@ class NacosServiceManager:
         Raises:
             ValueError: If required environment variables are missing
         """
-        server_address = os.getenv("NACOS_SERVER_ADDRESS")
-        namespace_id = os.getenv("NACOS_NAMESPACE_ID")
+        # Bind the environment lookup once for the repeated reads below
+        env = os.environ.get
+
+        server_address = env("NACOS_SERVER_ADDRESS")
+        namespace_id = env("NACOS_NAMESPACE_ID")
         
         if not server_address:
             raise ValueError(
@@ -134,49 +184,72 @@ class NacosServiceManager:
                 "Missing required environment variable: NACOS_NAMESPACE_ID\n"
                 "Please set it to your Nacos namespace, e.g., 'public'"
             )
-        
-        builder = ClientConfigBuilder()
-        builder.server_address(server_address)
-        builder.namespace_id(namespace_id)
-        
+
+        # Reuse the config built for this exact environment, if any
+        cache_key = (
+            server_address,
+            namespace_id,
+            env("NACOS_ACCESS_KEY"),
+            env("NACOS_SECRET_KEY"),
+            env("NACOS_USERNAME", "nacos"),
+            env("NACOS_PASSWORD", "nacos"),
+            env("NACOS_LOG_LEVEL", "INFO"),
+        )
+        cached = _env_config_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        builder = (
+            ClientConfigBuilder()
+            .server_address(server_address)
+            .namespace_id(namespace_id)
+            .log_level(env("NACOS_LOG_LEVEL", "INFO"))
+        )
+
         # Alibaba Cloud MSE authentication (priority)
-        access_key = os.getenv("NACOS_ACCESS_KEY")
-        secret_key = os.getenv("NACOS_SECRET_KEY")
+        access_key = env("NACOS_ACCESS_KEY")
+        secret_key = env("NACOS_SECRET_KEY")
         if access_key and secret_key:
-            builder.access_key(access_key)
-            builder.secret_key(secret_key)
+            builder = builder.access_key(access_key).secret_key(secret_key)
             logger.info(f"Loaded Nacos config from env (MSE auth): {server_address}")
         else:
             # Local Nacos authentication (fallback)
-            username = os.getenv("NACOS_USERNAME", "nacos")
-            password = os.getenv("NACOS_PASSWORD", "nacos")
-            builder.username(username)
-            builder.password(password)
+            builder = (
+                builder
+                .username(env("NACOS_USERNAME", "nacos"))
+                .password(env("NACOS_PASSWORD", "nacos"))
+            )
             logger.info(f"Loaded Nacos config from env (basic auth): {server_address}")
-        
-        # Optional configuration
-        log_level = os.getenv("NACOS_LOG_LEVEL", "INFO")
-        builder.log_level(log_level)
-        
-        return builder.build()
+
+        config = builder.build()
+        _env_config_cache[cache_key] = config
+        return config
     
     def _get_global_config(self) -> ClientConfig:
-        """Get global configuration (lazy loading).
-        
+        """Get global configuration (lazy loading, thread-safe).
+
         Priority:
         1. Manually set config (via set_global_config)
         2. Environment variable config
         """
-        if not self._global_config_loaded:
-            # If not manually set, load from environment variables
-            if not self._global_config_manually_set:
-                try:
-                    self._global_config = self.load_config_from_env()
-                    logger.info("Loaded global config from environment variables")
-                except ValueError as e:
-                    logger.error(f"Failed to load global config from env: {e}")
-                    raise
-            self._global_config_loaded = True
+        # Fast path: already loaded, no lock needed
+        if self._global_config_loaded:
+            return self._global_config
+
+        with self._global_config_lock:
+            # Double-check: another thread may have loaded it meanwhile
+            if not self._global_config_loaded:
+                # If not manually set, load from environment variables
+                if not self._global_config_manually_set:
+                    try:
+                        self._global_config = self.load_config_from_env()
+                        logger.info("Loaded global config from environment variables")
+                    except ValueError as e:
+                        logger.error(f"Failed to load global config from env: {e}")
+                        raise
+                # Warm the hash so the first service lookup is a pure hit
+                self._get_config_hash(self._global_config)
+                self._global_config_loaded = True
         return self._global_config
     
     @classmethod
@@ -203,6 +276,8 @@ class NacosServiceManager:
         manager._global_config = config
         manager._global_config_manually_set = True
         manager._global_config_loaded = True
+        # Warm the hash so the first service lookup is a pure hit
+        manager._get_config_hash(config)
         logger.info(
             f"Global config set manually: {config.server_list} / {config.namespace_id}"
         )
@@ -257,33 +332,52 @@ class NacosServiceManager:
         Returns:
             str: 16-character hash string
         """
-        # Get server list (sorted for consistency)
-        server_list = config.server_list if hasattr(config, 'server_list') else []
+        # The hash travels with the config object itself where possible,
+        # so any manager path (and any future manager) reuses it for free
+        cached = getattr(config, '_nacos_pool_hash', None)
+        if cached is None:
+            cached = self._config_hash_cache.get(id(config))
+        if cached is not None:
+            return cached
+
+        # Extract all plain fields in one attrgetter call; fall back to
+        # per-field getattr for config objects missing optional fields
+        try:
+            (server_list, endpoint, namespace_id, context_path,
+             username, credentials_provider) = _CONFIG_HASH_FIELDS(config)
+        except AttributeError:
+            server_list = getattr(config, 'server_list', None)
+            endpoint = getattr(config, 'endpoint', None)
+            namespace_id = getattr(config, 'namespace_id', None)
+            context_path = getattr(config, 'context_path', None)
+            username = getattr(config, 'username', None)
+            credentials_provider = getattr(config, 'credentials_provider', None)
+
+        # Sort the server list for consistency
         server_str = ",".join(sorted(server_list)) if server_list else ""
-        
-        # Get endpoint if available
-        endpoint = getattr(config, 'endpoint', None) or ""
-        
+
         # Get access_key from credentials_provider if available
         access_key = ""
-        if hasattr(config, 'credentials_provider') and config.credentials_provider:
-            credentials = config.credentials_provider.get_credentials()
+        if credentials_provider:
+            credentials = credentials_provider.get_credentials()
             if credentials:
                 access_key = credentials.access_key_id or ""
-        
-        # Build hash from connection-identifying fields
-        hash_parts = [
+
+        # Digest the connection-identifying fields (memoized per field set)
+        hash_value = _hash_config_fields(
             str(server_str),
-            str(endpoint),
-            str(config.namespace_id) if config.namespace_id else "",
-            str(getattr(config, 'context_path', None) or ""),
+            str(endpoint or ""),
+            str(namespace_id) if namespace_id else "",
+            str(context_path or ""),
             str(access_key),
-            str(getattr(config, 'username', None) or ""),
-        ]
-        
-        hash_string = "|".join(hash_parts)
-        hash_value = hashlib.md5(hash_string.encode()).hexdigest()[:16]
-        
+            str(username or ""),
+        )
+        try:
+            object.__setattr__(config, '_nacos_pool_hash', hash_value)
+        except (AttributeError, TypeError):
+            # Config type forbids extra attributes; fall back to id cache
+            self._config_hash_cache[id(config)] = hash_value
+
         logger.debug(
             f"Generated config hash {hash_value} for "
             f"servers={server_str or endpoint}, namespace={config.namespace_id}"
@@ -291,109 +385,99 @@ class NacosServiceManager:
         
         return hash_value
     
-    def _get_lock(self, config_hash: str) -> asyncio.Lock:
-        """Get lock for config (lazy creation)"""
-        if config_hash not in self._service_locks:
-            self._service_locks[config_hash] = asyncio.Lock()
-        return self._service_locks[config_hash]
-    
     # ==================== Service Retrieval ====================
-    
+
+    async def _get_or_create_service(
+        self,
+        client_config: Optional[ClientConfig],
+        service_type: str,
+        factory,
+    ):
+        """Get or create a pooled service instance (shared implementation).
+
+        ClientConfigs live in _configs and service groups in _services,
+        so group entries are always service instances.
+
+        Args:
+            client_config: Optional custom config, uses global config if None
+            service_type: Pool key for the service ("naming"/"config"/"ai")
+            factory: Async callable creating the service from a ClientConfig
+
+        Returns:
+            The pooled service instance (reuses existing connection)
+        """
+        config = client_config if client_config else self._get_global_config()
+        config_hash = self._get_config_hash(config)
+
+        # Fast path: existing service, lock-free dict reads only
+        service_group = self._services.get(config_hash)
+        if service_group is not None:
+            service = service_group.get(service_type)
+            if service is not None:
+                return service
+
+        # Slow path: take the lock only on a miss, re-check inside
+        async with self._creation_lock:
+            service_group = self._services.get(config_hash)
+            if service_group is None:
+                service_group = {}
+                self._configs[config_hash] = config
+                self._services[config_hash] = service_group
+                logger.info(f"Created service group for config hash: {config_hash}")
+            if service_type not in service_group:
+                logger.info(f"Creating {service_type} service for hash: {config_hash}")
+                service_group[service_type] = await factory(config)
+                logger.info(f"{service_type} service created for hash: {config_hash}")
+
+        return service_group[service_type]
+
     async def get_naming_service(
         self,
         client_config: Optional[ClientConfig] = None,
     ) -> NacosNamingService:
         """Get NacosNamingService.
-        
+
         Args:
             client_config: Optional custom config, uses global config if None
-            
+
         Returns:
             NacosNamingService: Naming service instance (reuses existing connection)
         """
-        # 1. Determine which config to use
-        config = client_config if client_config else self._get_global_config()
-        config_hash = self._get_config_hash(config)
-        
-        # 2. Check if service pool already has this config group
-        if config_hash not in self._service_pool:
-            async with self._get_lock(config_hash):
-                if config_hash not in self._service_pool:
-                    self._service_pool[config_hash] = {"config": config}
-                    logger.info(f"Created service group for config hash: {config_hash}")
-        
-        # 3. Check if this config group has naming service
-        service_group = self._service_pool[config_hash]
-        if "naming" not in service_group:
-            async with self._get_lock(config_hash):
-                if "naming" not in service_group:
-                    logger.info(f"Creating NacosNamingService for hash: {config_hash}")
-                    service_group["naming"] = await NacosNamingService.create_naming_service(config)
-                    logger.info(f"NacosNamingService created for hash: {config_hash}")
-        
-        return service_group["naming"]
-    
+        return await self._get_or_create_service(
+            client_config, "naming", NacosNamingService.create_naming_service
+        )
+
     async def get_config_service(
         self,
         client_config: Optional[ClientConfig] = None,
     ) -> NacosConfigService:
         """Get NacosConfigService.
-        
+
         Args:
             client_config: Optional custom config, uses global config if None
-            
+
         Returns:
             NacosConfigService: Config service instance (reuses existing connection)
         """
-        config = client_config if client_config else self._get_global_config()
-        config_hash = self._get_config_hash(config)
-        
-        if config_hash not in self._service_pool:
-            async with self._get_lock(config_hash):
-                if config_hash not in self._service_pool:
-                    self._service_pool[config_hash] = {}
-                    logger.info(f"Created service group for config hash: {config_hash}")
-        
-        service_group = self._service_pool[config_hash]
-        if "config" not in service_group:
-            async with self._get_lock(config_hash):
-                if "config" not in service_group:
-                    logger.info(f"Creating NacosConfigService for hash: {config_hash}")
-                    service_group["config"] = await NacosConfigService.create_config_service(config)
-                    logger.info(f"NacosConfigService created for hash: {config_hash}")
-        
-        return service_group["config"]
-    
+        return await self._get_or_create_service(
+            client_config, "config", NacosConfigService.create_config_service
+        )
+
     async def get_ai_service(
         self,
         client_config: Optional[ClientConfig] = None,
     ) -> NacosAIService:
         """Get NacosAIService.
-        
+
         Args:
             client_config: Optional custom config, uses global config if None
-            
+
         Returns:
             NacosAIService: AI service instance (reuses existing connection)
         """
-        config = client_config if client_config else self._get_global_config()
-        config_hash = self._get_config_hash(config)
-        
-        if config_hash not in self._service_pool:
-            async with self._get_lock(config_hash):
-                if config_hash not in self._service_pool:
-                    self._service_pool[config_hash] = {"config": config}
-                    logger.info(f"Created service group for config hash: {config_hash}")
-        
-        service_group = self._service_pool[config_hash]
-        if "ai" not in service_group:
-            async with self._get_lock(config_hash):
-                if "ai" not in service_group:
-                    logger.info(f"Creating NacosAIService for hash: {config_hash}")
-                    service_group["ai"] = await NacosAIService.create_ai_service(config)
-                    logger.info(f"NacosAIService created for hash: {config_hash}")
-        
-        return service_group["ai"]
+        return await self._get_or_create_service(
+            client_config, "ai", NacosAIService.create_ai_service
+        )
     
     # ==================== Statistics and Management ====================
     
@@ -421,20 +505,20 @@ class NacosServiceManager:
         configs_info = []
         total_services = 0
         
-        for config_hash, service_group in manager._service_pool.items():
-            config = service_group.get("config")
-            services = [k for k in service_group.keys() if k != "config"]
+        for config_hash, service_group in manager._services.items():
+            config = manager._configs.get(config_hash)
+            services = list(service_group.keys())
             total_services += len(services)
-            
+
             configs_info.append({
                 "hash": config_hash,
                 "server": config.server_address if config else "unknown",
                 "namespace": config.namespace_id if config else "unknown",
                 "services": services,
             })
-        
+
         return {
-            "config_count": len(manager._service_pool),
+            "config_count": len(manager._services),
             "total_services": total_services,
             "configs": configs_info,
         }
@@ -446,31 +530,41 @@ class NacosServiceManager:
         Note: Service instances need to be re-obtained after cleanup
         """
         manager = cls()
-        
+
         logger.info("Cleaning up NacosServiceManager...")
-        
-        # Clean up all services
-        cleanup_count = 0
-        for config_hash, service_group in manager._service_pool.items():
+
+        # Collect close/shutdown coroutines so all services shut down
+        # concurrently instead of serially awaiting each connection
+        tasks = []
+        task_info = []  # (config_hash, service_type), parallel to tasks
+        for config_hash, service_group in manager._services.items():
             for service_type in ["ai", "config", "naming"]:
                 if service_type in service_group:
                     service = service_group[service_type]
-                    try:
-                        # Try to call cleanup method (if available)
-                        if hasattr(service, "close"):
-                            await service.close()
-                        elif hasattr(service, "shutdown"):
-                            await service.shutdown()
-                        cleanup_count += 1
-                    except Exception as e:
-                        logger.warning(
-                            f"Failed to cleanup {service_type} service "
-                            f"for hash {config_hash}: {e}"
-                        )
-        
+                    # Try to call cleanup method (if available)
+                    if hasattr(service, "close"):
+                        tasks.append(service.close())
+                    elif hasattr(service, "shutdown"):
+                        tasks.append(service.shutdown())
+                    else:
+                        continue
+                    task_info.append((config_hash, service_type))
+
+        cleanup_count = 0
+        if tasks:
+            results = await asyncio.gather(*tasks, return_exceptions=True)
+            for (config_hash, service_type), result in zip(task_info, results):
+                if isinstance(result, Exception):
+                    logger.warning(
+                        f"Failed to cleanup {service_type} service "
+                        f"for hash {config_hash}: {result}"
+                    )
+                else:
+                    cleanup_count += 1
+
         # Clear service pool
-        manager._service_pool.clear()
-        manager._service_locks.clear()
+        manager._services.clear()
+        manager._configs.clear()
         
         logger.info(f"Cleaned up {cleanup_count} services")
     
@@ -482,26 +576,28 @@ class NacosServiceManager:
 
 # ==================== Convenience Functions ====================
 
+# Module-level handle to the singleton; the convenience functions skip
+# the per-call constructor round trip through __new__
+_MANAGER = NacosServiceManager()
+
+
 async def get_nacos_naming_service(
     client_config: Optional[ClientConfig] = None,
 ) -> NacosNamingService:
     """Convenience function: Get NacosNamingService"""
-    manager = NacosServiceManager()
-    return await manager.get_naming_service(client_config)
+    return await _MANAGER.get_naming_service(client_config)
 
 
 async def get_nacos_config_service(
     client_config: Optional[ClientConfig] = None,
 ) -> NacosConfigService:
     """Convenience function: Get NacosConfigService"""
-    manager = NacosServiceManager()
-    return await manager.get_config_service(client_config)
+    return await _MANAGER.get_config_service(client_config)
 
 
 async def get_nacos_ai_service(
     client_config: Optional[ClientConfig] = None,
 ) -> NacosAIService:
     """Convenience function: Get NacosAIService"""
-    manager = NacosServiceManager()
-    return await manager.get_ai_service(client_config)
+    return await _MANAGER.get_ai_service(client_config)
 
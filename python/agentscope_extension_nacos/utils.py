@@ -1,22 +1,50 @@
+from __future__ import annotations
+
 import asyncio
 import logging
 import random
 import re
 import socket
 from contextlib import asynccontextmanager
+from typing import TYPE_CHECKING
 
-import psutil
-from v2.nacos.ai.model.mcp.mcp import McpEndpointInfo, McpServerDetailInfo
+if TYPE_CHECKING:
+	from v2.nacos.ai.model.mcp.mcp import McpEndpointInfo, McpServerDetailInfo
 
 # Initialize logger
 logger = logging.getLogger(__name__)
 
+# Allowed characters for agent names (compiled once, not per validation)
+_AGENT_NAME_RE = re.compile(r'^[a-zA-Z0-9._:-]+$')
+
+# Memoized result of get_first_non_loopback_ip; interface enumeration is
+# comparatively expensive and the local address is stable for the process
+_first_non_loopback_ip: str | None = None
+_first_non_loopback_ip_resolved = False
+
 def get_first_non_loopback_ip():
 	"""Get the first non-loopback IPv4 address from network interfaces.
-	
+
+	The result is resolved once and cached for the lifetime of the
+	process, so repeat callers (every adapter and example) skip the
+	interface scan.
+
 	Returns:
 		str | None: The first non-loopback IP address, or None if not found
 	"""
+	global _first_non_loopback_ip, _first_non_loopback_ip_resolved
+	if _first_non_loopback_ip_resolved:
+		return _first_non_loopback_ip
+
+	# Lazy import: only callers that need interface discovery pay for psutil
+	import psutil
+
+	_first_non_loopback_ip = _scan_first_non_loopback_ip(psutil)
+	_first_non_loopback_ip_resolved = True
+	return _first_non_loopback_ip
+
+def _scan_first_non_loopback_ip(psutil):
+	"""Scan network interfaces for the first non-loopback IPv4 address."""
 	for interface, addrs in psutil.net_if_addrs().items():
 		for addr in addrs:
 			if addr.family == socket.AF_INET and not addr.address.startswith(
@@ -83,10 +111,10 @@ def validate_agent_name(agent_name: str) -> str:
 		logger.error("Agent name validation failed: empty name")
 		raise ValueError("Agent name cannot be empty")
 
-	# Replace spaces with underscores
-	original_name = agent_name
-	agent_name = agent_name.replace(' ', '_')
-	if original_name != agent_name:
+	# Replace spaces with underscores (skip the copy when there are none)
+	if ' ' in agent_name:
+		original_name = agent_name
+		agent_name = agent_name.replace(' ', '_')
 		logger.debug(f"Agent name spaces replaced: '{original_name}' -> '{agent_name}'")
 
 	# Check length
@@ -95,7 +123,7 @@ def validate_agent_name(agent_name: str) -> str:
 		raise ValueError("Agent name cannot exceed 128 characters")
 
 	# Check if characters conform to standards: letters, digits, '.', ':', '_', '-'
-	if not re.match(r'^[a-zA-Z0-9._:-]+$', agent_name):
+	if not _AGENT_NAME_RE.match(agent_name):
 		logger.error(f"Agent name validation failed: invalid characters in '{agent_name}'")
 		raise ValueError("Agent name can only contain letters, digits, '.', ':', '_', and '-'")
 
@@ -17,7 +17,9 @@ Client Access:
 """
 
 import asyncio
+import logging
 import os
+import signal
 from contextlib import asynccontextmanager
 
 from agentscope.agent import ReActAgent
@@ -31,18 +33,24 @@ from agentscope_extension_nacos.a2a.nacos import (
     A2AFastAPINacosAdaptor,
 )
 
+# Connection settings used throughout this example
+NACOS_SERVER_ADDRESS = "localhost:8848"
+NACOS_NAMESPACE_ID = "public"
+SERVICE_HOST = "localhost"
+SERVICE_PORT = 8090
+
 # Configure Nacos connection
 client_config = (
     ClientConfigBuilder()
-    .server_address("localhost:8848")
-    .namespace_id("public")
+    .server_address(NACOS_SERVER_ADDRESS)
+    .namespace_id(NACOS_NAMESPACE_ID)
     .log_level("DEBUG")  # Set to DEBUG level for detailed logs
     .build()
 )
 
 agent: AgentScopeAgent | None = None
 
-print("✅ AgentScope agent created successfully")
+logger = logging.getLogger(__name__)
 
 
 @asynccontextmanager
@@ -62,7 +70,8 @@ async def create_runner():
         },
         agent_builder=ReActAgent,
     )
-    
+    logger.info("AgentScope agent created successfully")
+
     # Create runner with context manager
     async with Runner(
         agent=agent,
@@ -74,14 +83,22 @@ async def create_runner():
 
 async def deploy_agent(runner):
     """Deploy the agent as an A2A service and register to Nacos."""
-    
+    from agentscope_extension_nacos.nacos_service_manager import (
+        NacosServiceManager,
+    )
+
+    # Pre-warm the pooled Nacos AI service so the connection handshake
+    # happens before deployment instead of inside the background
+    # registration task
+    await NacosServiceManager().get_ai_service(client_config)
+
     # Create deployment manager
-    # This will serve the agent on localhost:8090
+    # This will serve the agent on SERVICE_HOST:SERVICE_PORT
     deploy_manager = LocalDeployManager(
-        host="localhost",
-        port=8090,
+        host=SERVICE_HOST,
+        port=SERVICE_PORT,
     )
-    
+
     # Create A2A Nacos adapter
     # This will:
     # 1. Expose the agent via A2A protocol
@@ -90,7 +107,7 @@ async def deploy_agent(runner):
     nacos_a2a_protocol = A2AFastAPINacosAdaptor(
         nacos_client_config=client_config,
         agent=agent,
-        host="localhost",
+        host=SERVICE_HOST,
     )
     
     # Deploy agent with A2A protocol adapter
@@ -101,26 +118,48 @@ async def deploy_agent(runner):
         stream=True,  # Enable streaming responses
     )
     
-    print(f"🚀 Agent deployed at: {deploy_result}")
-    print(f"🌐 Service URL: {deploy_manager.service_url}")
-    print(f"💚 Health check: {deploy_manager.service_url}/health")
-    print(f"📝 Agent Card registered to Nacos A2A Registry")
+    # One write for the whole banner instead of a print per line
+    print(
+        f"🚀 Agent deployed at: {deploy_result}\n"
+        f"🌐 Service URL: {deploy_manager.service_url}\n"
+        f"💚 Health check: {deploy_manager.service_url}/health\n"
+        f"📝 Agent Card registered to Nacos A2A Registry"
+    )
 
     return deploy_manager
 
 
 async def run_deployment():
-    """Run the deployment and keep the service alive."""
+    """Run the deployment and keep the service alive until shutdown."""
+    from agentscope_extension_nacos.nacos_service_manager import (
+        NacosServiceManager,
+    )
+
+    stop_event = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, stop_event.set)
+
     async with create_runner() as runner:
         deploy_manager = await deploy_agent(runner)
 
-    # Keep the service running
-    # In production, you'd handle this differently (e.g., with proper shutdown handlers)
-    print("🏃 Service is running...")
-    await asyncio.sleep(1000)
+        # Keep the service running (inside the runner context) until
+        # SIGINT/SIGTERM instead of sleeping for a fixed duration
+        print("🏃 Service is running... (Ctrl+C to stop)")
+        await stop_event.wait()
+
+    print("🛑 Shutting down, cleaning up Nacos connections...")
+    await NacosServiceManager.cleanup()
 
     return deploy_manager
 
 
 if __name__ == "__main__":
+    # Use uvloop for the event loop when it is installed
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
+
     asyncio.run(run_deployment())
@@ -15,6 +15,8 @@ Features:
 """
 
 import asyncio
+import logging
+import signal
 from contextlib import asynccontextmanager
 
 from agentscope_runtime.engine import Runner, LocalDeployManager
@@ -29,31 +31,46 @@ from agentscope_extension_nacos.nacos_react_agent import (
     NacosAgentListener,
 )
 
-# Configure Nacos connection
-client_config = (
-    ClientConfigBuilder()
-    .server_address("localhost:8848")
-    .namespace_id("public")
-    .log_level("DEBUG")  # Set to DEBUG level for detailed logs
-    .build()
-)
+# Connection settings used throughout this example
+NACOS_SERVER_ADDRESS = "localhost:8848"
+NACOS_NAMESPACE_ID = "public"
+SERVICE_HOST = "localhost"
+SERVICE_PORT = 8090
 
-# Create Nacos agent listener
-# This will load agent configurations from Nacos
-nacos_agent_listener = NacosAgentListener(
-    nacos_client_config=client_config, agent_name="test-agent"
-)
+# Built lazily in create_runner so importing this module has no side effects
+client_config = None
+nacos_agent_listener = None
 
 agent: AgentScopeAgent | None = None
 
-print("✅ AgentScope agent created successfully")
+logger = logging.getLogger(__name__)
+
+
+def create_client_config():
+    """Configure the Nacos connection."""
+    return (
+        ClientConfigBuilder()
+        .server_address(NACOS_SERVER_ADDRESS)
+        .namespace_id(NACOS_NAMESPACE_ID)
+        .log_level("DEBUG")  # Set to DEBUG level for detailed logs
+        .build()
+    )
 
 
 @asynccontextmanager
 async def create_runner():
     """Create and initialize the agent runner."""
-    global agent
-    
+    global agent, client_config, nacos_agent_listener
+
+    # Configure Nacos connection
+    client_config = create_client_config()
+
+    # Create Nacos agent listener
+    # This will load agent configurations from Nacos
+    nacos_agent_listener = NacosAgentListener(
+        nacos_client_config=client_config, agent_name="test-agent"
+    )
+
     # Initialize Nacos listener to load configurations
     await nacos_agent_listener.initialize()
     
@@ -66,6 +83,7 @@ async def create_runner():
         },
         agent_builder=NacosReActAgent,
     )
+    logger.info("AgentScope agent created successfully")
 
     # Create runner with context manager
     async with Runner(
@@ -80,10 +98,10 @@ async def deploy_agent(runner):
     """Deploy the agent as a service."""
     
     # Create deployment manager
-    # This will serve the agent on localhost:8090
+    # This will serve the agent on SERVICE_HOST:SERVICE_PORT
     deploy_manager = LocalDeployManager(
-        host="localhost",
-        port=8090,
+        host=SERVICE_HOST,
+        port=SERVICE_PORT,
     )
 
     # Create A2A protocol adapter
@@ -91,7 +109,7 @@ async def deploy_agent(runner):
     a2a_protocol = A2AFastAPINacosAdaptor(
         nacos_client_config=client_config,
         agent=agent,
-        host="localhost",
+        host=SERVICE_HOST,
     )
     
     # Deploy agent with A2A protocol support
@@ -101,25 +119,47 @@ async def deploy_agent(runner):
         stream=True,  # Enable streaming responses
     )
     
-    print(f"🚀 Agent deployed at: {deploy_result}")
-    print(f"🌐 Service URL: {deploy_manager.service_url}")
-    print(f"💚 Health check: {deploy_manager.service_url}/health")
+    # One write for the whole banner instead of a print per line
+    print(
+        f"🚀 Agent deployed at: {deploy_result}\n"
+        f"🌐 Service URL: {deploy_manager.service_url}\n"
+        f"💚 Health check: {deploy_manager.service_url}/health"
+    )
 
     return deploy_manager
 
 
 async def run_deployment():
-    """Run the deployment and keep the service alive."""
+    """Run the deployment and keep the service alive until shutdown."""
+    from agentscope_extension_nacos.nacos_service_manager import (
+        NacosServiceManager,
+    )
+
+    stop_event = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, stop_event.set)
+
     async with create_runner() as runner:
         deploy_manager = await deploy_agent(runner)
 
-    # Keep the service running
-    # In production, you'd handle this differently (e.g., with proper shutdown handlers)
-    print("🏃 Service is running...")
-    await asyncio.sleep(1000)
+        # Keep the service running (inside the runner context) until
+        # SIGINT/SIGTERM instead of sleeping for a fixed duration
+        print("🏃 Service is running... (Ctrl+C to stop)")
+        await stop_event.wait()
+
+    print("🛑 Shutting down, cleaning up Nacos connections...")
+    await NacosServiceManager.cleanup()
 
     return deploy_manager
 
 
 if __name__ == "__main__":
+    # Use uvloop for the event loop when it is installed
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
+
     asyncio.run(run_deployment())